@@ -12,12 +12,15 @@ bl_info = {
     "category": "Productivity",
 }
 
-classes = ()
+_ADD = "timer.add_task"
+_REMOVE = "timer.remove_task"
+_MOVE = "timer.move_task"
+
+classes = []
 
 
 def register_class(cls):
-    global classes
-    classes += (cls,)
+    classes.append(cls)
     return cls
 
 
@@ -37,7 +40,7 @@ class TimerProps(bpy.types.PropertyGroup):
 @register_class
 class TimerAddTask(bpy.types.Operator):
     """Add a task"""
-    bl_idname = "timer.add_task"
+    bl_idname = _ADD
     bl_label = "Add Task"
 
     task: bpy.props.StringProperty()
@@ -60,7 +63,7 @@ class TimerAddTask(bpy.types.Operator):
 @register_class
 class TimerRemoveTask(bpy.types.Operator):
     """Remove current task"""
-    bl_idname = "timer.remove_task"
+    bl_idname = _REMOVE
     bl_label = "Remove Task"
 
     @classmethod
@@ -71,8 +74,8 @@ class TimerRemoveTask(bpy.types.Operator):
     def execute(self, context):
         timer = context.scene.timer
         timer.tasks.remove(timer.active_task_index)
-        if timer.active_task_index >= len(timer.tasks):
-            timer.active_task_index = len(timer.tasks) - 1
+        n = len(timer.tasks)
+        timer.active_task_index = min(timer.active_task_index, n - 1) if n else 0
         return {"FINISHED"}
 
 
@@ -80,13 +83,10 @@ class TimerRemoveTask(bpy.types.Operator):
 class TimerMoveTask(bpy.types.Operator):
     """Move task up or down"""
 
-    bl_idname = "timer.move_task"
+    bl_idname = _MOVE
     bl_label = "Move task"
 
-    direction: bpy.props.EnumProperty(items=[
-        ('UP', 'Up', 'Move one position up'),
-        ('DOWN', 'Down', 'Move one position down')
-    ])
+    delta: bpy.props.IntProperty(default=1, description="Positions to move, negative moves up")
 
     @classmethod
     def poll(cls, context):
@@ -96,9 +96,8 @@ class TimerMoveTask(bpy.types.Operator):
     def execute(self, context):
         timer = context.scene.timer
 
-        delta = 1 if self.direction == 'DOWN' else -1
-        target = timer.active_task_index + delta
-        target = max(min(target, len(timer.tasks) - 1), 0)
+        n = len(timer.tasks)
+        target = 0 if n == 0 else max(0, min(timer.active_task_index + self.delta, n - 1))
 
         timer.tasks.move(timer.active_task_index, target)
         timer.active_task_index = target
@@ -109,18 +108,21 @@ class TimerMoveTask(bpy.types.Operator):
 @register_class
 class TIMER_UL_tasks(bpy.types.UIList):
     def draw_item(self, context, layout, data, item, icon, active_data, active_propname):
-        if self.layout_type in {'DEFAULT', 'COMPACT'}:
-            if item.complete:
-                layout.active = False
-
-            row = layout.row()
-            row.prop(item, "complete", text="", emboss=True)
-            row.prop(item, "name", text="", emboss=False, icon_value=icon)
+        layout_type = self.layout_type
 
         # 'GRID' layout type should be as compact as possible (typically a single icon!).
-        elif self.layout_type in {'GRID'}:
+        if layout_type == 'GRID':
             layout.alignment = 'CENTER'
             layout.label(text="", icon_value=icon)
+            return
+
+        if layout_type in {'DEFAULT', 'COMPACT'}:
+            if item.complete:
+                layout.active = False
+
+            row_prop = layout.row().prop
+            row_prop(item, "complete", text="", emboss=True)
+            row_prop(item, "name", text="", emboss=False, icon_value=icon)
 
 
 @register_class
@@ -140,24 +142,22 @@ class Timer(bpy.types.Panel):
         col.template_list("TIMER_UL_tasks", "", timer, "tasks", timer, "active_task_index")
 
         col = row.column(align=True)
-        col.operator('timer.add_task', text="", icon="ADD")
-        col.operator('timer.remove_task', text="", icon="REMOVE")
+        operator = col.operator
+        operator(_ADD, text="", icon="ADD")
+        operator(_REMOVE, text="", icon="REMOVE")
 
         col.separator()
-        col.operator('timer.move_task', text="", icon="TRIA_UP").direction = 'UP'
-        col.operator('timer.move_task', text="", icon="TRIA_DOWN").direction = 'DOWN'
+        operator(_MOVE, text="", icon="TRIA_UP").delta = -1
+        operator(_MOVE, text="", icon="TRIA_DOWN").delta = 1
 
 
-def register():
-    for cls in classes:
-        bpy.utils.register_class(cls)
+_register, unregister = bpy.utils.register_classes_factory(classes)
 
-    bpy.types.Scene.timer = bpy.props.PointerProperty(type=TimerProps)
 
+def register():
+    _register()
 
-def unregister():
-    for cls in classes:
-        bpy.utils.unregister_class(cls)
+    bpy.types.Scene.timer = bpy.props.PointerProperty(type=TimerProps)
 
 
 if __name__ == "__main__":